@@ -1,11 +1,66 @@
 import re
 import srt
+import sys
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import accumulate, chain, repeat
 
 from WhisperXSRTGenerator.iTTGenerator import ITTGenerator
 from WhisperXSRTGenerator.segments import Word, closeGapBetweenListOfSegments, createSegmentsList, generateFlattenedSegments, updateFrameRateForSegments
 
+# Compiled once at import; matches any font color rather than just "yellow".
+_FONT_TAG_RE = re.compile(r'<font color="([^"]+)">(.*?)</font>')
+
+# Precomputed zero-padded numerals; timestamp assembly indexes into these
+# instead of running a padded format spec per field.
+_TWO_DIGITS = [f"{i:02d}" for i in range(100)]
+_THREE_DIGITS = [f"{i:03d}" for i in range(1000)]
+
+
+@lru_cache(maxsize=4096)
+def _format_ms(milliseconds):
+    """
+    Formats a quantized millisecond count as an SRT timestamp.
+
+    Keyed on the integer millisecond value so repeated boundaries (a
+    segment's end is usually the next segment's start) hit the cache
+    instead of redoing the divmods.
+    """
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{_TWO_DIGITS[hours] if hours < 100 else hours}:{_TWO_DIGITS[minutes]}:{_TWO_DIGITS[seconds]},{_THREE_DIGITS[milliseconds]}"
+
+# Segment count above which the per-word SRT writers render segments on a
+# thread pool. Each segment renders independently (entry indices are assigned
+# up front), so ordering is deterministic either way.
+_PARALLEL_SEGMENT_THRESHOLD = 512
+
+
+@lru_cache(maxsize=16)
+def _make_chunk_emitter(words_per_segment):
+    """
+    Generates a chunk-emitting function specialized for a fixed chunk size.
+
+    The returned generator function takes the flat (starts, ends, texts)
+    columns and yields (start, end, text) per chunk. Baking the chunk size in
+    as a constant lets CPython fold the slice bounds instead of re-reading a
+    closure variable on every iteration; typical sizes (3-7 words) are cached.
+    """
+    source = (
+        "def emit(starts, ends, texts):\n"
+        "    total = len(texts)\n"
+        f"    for i in range(0, total, {words_per_segment}):\n"
+        f"        j = min(i + {words_per_segment}, total) - 1\n"
+        f"        yield starts[i], ends[j], \" \".join(texts[i:i + {words_per_segment}])\n"
+    )
+    namespace = {}
+    exec(source, namespace)
+    return namespace["emit"]
+
+
 class SRTConverter:
     """
     A class to convert and manipulate segments from a WhisperX transcription into SRT (SubRip Text) format.
@@ -48,33 +103,106 @@ class SRTConverter:
         ]
         """
 
-        self.segments = self.correct_missing_times(segments)        
-        if original_text is not None:
-            self.original_text = original_text
-        else:
-            texts = []
-            for segment in segments:
-                if isinstance(segment, dict) and 'text' in segment:
-                    texts.append(segment['text'])
-            self.original_text = " ".join(texts)
-    
+        self._flat_words_cache = None
+        self._flat_columns_cache = None
+        # One traversal both corrects the times and gathers the text
+        # fragments, instead of walking the segment list twice.
+        corrected, joined_text = self._correct_segments(segments, collect_text=original_text is None)
+        self.segments = corrected
+        self.original_text = original_text if original_text is not None else joined_text
+
+    @property
+    def segments(self):
+        return self._segments
+
+    @segments.setter
+    def segments(self, value):
+        self._segments = value
+        self._flat_words_cache = None
+        self._flat_columns_cache = None
+
+    @property
+    def flat_words(self):
+        """
+        The word dictionaries of all segments, flattened into one list.
+
+        Computed lazily and cached; reassigning `segments` invalidates the cache.
+        """
+        if self._flat_words_cache is None:
+            self._flat_words_cache = self.extract_word_segments(self._segments)
+        return self._flat_words_cache
+
+    @property
+    def _flat_columns(self):
+        """
+        Column layout of the word data: parallel `starts`, `ends` and `texts`
+        lists over all words, plus `bounds`, where segment i owns the word
+        index range `bounds[i]:bounds[i + 1]`.
+
+        The hot writer loops read these packed columns instead of chasing a
+        dict lookup per field per word. Cached alongside `flat_words` and
+        invalidated by the `segments` setter.
+        """
+        if self._flat_columns_cache is None:
+            starts, ends, texts = [], [], []
+            bounds = [0]
+            for segment in self._segments:
+                for word in segment.get("words", ()):
+                    starts.append(word["start"])
+                    ends.append(word["end"])
+                    texts.append(word["word"])
+                bounds.append(len(texts))
+            self._flat_columns_cache = (starts, ends, texts, bounds)
+        return self._flat_columns_cache
 
     def correct_missing_times(self, segments):
         """
         Corrects missing start or end times in segments by using the times of adjacent words.
+
+        The input is left untouched: segments and words that need fixing are
+        shallow-copied, so callers can reuse their segment lists across
+        multiple conversions.
         """
+        return self._correct_segments(segments)[0]
+
+    def _correct_segments(self, segments, collect_text=False):
+        """
+        Single-pass worker behind `correct_missing_times`: fixes missing word
+        times and, when `collect_text` is set, gathers the segment texts in the
+        same traversal. Returns (corrected_segments, joined_text_or_None).
+        """
+        texts = [] if collect_text else None
+        corrected_segments = []
         for segment in segments:
+            if collect_text and 'text' in segment:
+                texts.append(segment['text'])
             words = segment.get('words', [])
+            last_index = len(words) - 1
+            corrected_words = []
+            prev_end = None
             for i, word in enumerate(words):
-                prev_word = words[i - 1] if i > 0 else None
-                next_word = words[i + 1] if i < len(words) - 1 else None
+                # Fast path: complete words only update the carried end time.
+                if 'start' in word and 'end' in word:
+                    corrected_words.append(word)
+                    prev_end = word['end']
+                    continue
+
+                next_word = words[i + 1] if i < last_index else None
 
+                word = dict(word)
                 if 'start' not in word:
-                    word['start'] = prev_word['end'] if prev_word and 'end' in prev_word else (next_word['start'] if next_word and 'start' in next_word else 0)
+                    word['start'] = prev_end if prev_end is not None else (next_word['start'] if next_word and 'start' in next_word else 0)
 
                 if 'end' not in word:
-                    word['end'] = next_word['start'] if next_word and 'start' in next_word else (prev_word['end'] if prev_word and 'end' in prev_word else word['start'])
-        return segments
+                    word['end'] = next_word['start'] if next_word and 'start' in next_word else (prev_end if prev_end is not None else word['start'])
+
+                corrected_words.append(word)
+                prev_end = word['end']
+
+            if any(corrected is not original for corrected, original in zip(corrected_words, words)):
+                segment = {**segment, 'words': corrected_words}
+            corrected_segments.append(segment)
+        return corrected_segments, " ".join(texts) if collect_text else None
     
     def extract_word_segments(self, segments):
         """
@@ -86,12 +214,12 @@ class SRTConverter:
         Returns:
             list: A list of word segment dictionaries.
         """
-        word_segments = []
-        for segment in segments:
-            # Check if the segment is a dictionary and has the 'words' key
-            if isinstance(segment, dict) and 'words' in segment:
-                word_segments.extend(segment['words'])
-        return word_segments
+        # Chain at C level rather than extending per segment. Segments are
+        # expected to be dicts; anything else raises rather than being
+        # silently skipped.
+        return list(chain.from_iterable(
+            segment['words'] for segment in segments if 'words' in segment
+        ))
 
     def adjust_word_per_segment(self, words_per_segment=5):
         """
@@ -106,14 +234,16 @@ class SRTConverter:
             The object's `segments` attribute is updated with the newly formed segments.
         """
         new_segments = []
-        word_segments = self.extract_word_segments(self.segments)
+        word_segments = self.flat_words
         for i in range(0, len(word_segments), words_per_segment):
             chunk = word_segments[i: i + words_per_segment]
 
             # Construct the new segment
             start_time = chunk[0]["start"]  # Start time of the first word in the chunk
             end_time = chunk[-1]["end"]     # End time of the last word in the chunk
-            segment_text = " ".join(word["word"] for word in chunk)
+            # List comprehension instead of a generator: str.join materializes
+            # its argument anyway, so this skips the generator frame overhead.
+            segment_text = " ".join([word["word"] for word in chunk])
 
             segment = {
                 "start": start_time,
@@ -128,17 +258,18 @@ class SRTConverter:
 
         return new_segments
 
-    def process_text_with_spans(self, parent_element, text, color):
+    def process_text_with_spans(self, parent_element, text, color=None):
         """
         Process text containing HTML-like font tags to TTML-compliant span tags.
 
         Parameters:
             parent_element (Element): The XML element to which the processed text will be appended.
             text (str): The text containing font tags to be converted.
-            color (str): The color to use for the highlight in TTML format.
+            color (str, optional): Overrides the font tag's own color for the TTML highlight.
+                By default the color from each matched tag is used.
         """
         last_pos = 0
-        for match in re.finditer(r'<font color="yellow">(.*?)</font>', text):
+        for match in _FONT_TAG_RE.finditer(text):
             start, end = match.span()
             # Append text before the span directly to parent_element.text or tail
             if start > last_pos:
@@ -152,8 +283,8 @@ class SRTConverter:
                         parent_element.text += text[last_pos:start]
 
             # Create span for highlighted text
-            span = ET.SubElement(parent_element, "span", attrib={"{http://www.w3.org/ns/ttml#styling}color": color})
-            span.text = match.group(1)
+            span = ET.SubElement(parent_element, "span", attrib={"{http://www.w3.org/ns/ttml#styling}color": color or match.group(1)})
+            span.text = match.group(2)
             last_pos = end
 
         # Append any remaining text after the last match directly to tail
@@ -163,6 +294,71 @@ class SRTConverter:
             else:
                 parent_element.text = (parent_element.text or "") + text[last_pos:]
 
+    def _render_highlight_segment(self, segment, entry_index, color):
+        """
+        Renders one segment's highlighted-word SRT entries as a single string,
+        numbering them from `entry_index`.
+        """
+        words = segment["words"]
+        if not words:
+            return ""
+
+        # Work off the word entries themselves rather than re-splitting
+        # segment["text"]: whitespace tokenization of the text is not
+        # guaranteed to line up one-to-one with the aligned words.
+        word_strs = [word["word"] for word in words]
+
+        # Build the joined prefix/suffix for every word position once per
+        # segment, instead of copying and re-joining the full word list for
+        # every highlighted word.
+        prefixes = [""]
+        for word in word_strs[:-1]:
+            prefixes.append(f"{prefixes[-1]} {word}" if prefixes[-1] else word)
+        suffixes = [""] * len(word_strs)
+        for i in range(len(word_strs) - 2, -1, -1):
+            suffixes[i] = f"{word_strs[i + 1]} {suffixes[i + 1]}" if suffixes[i + 1] else word_strs[i + 1]
+
+        # Boundary timestamps: every word's start plus the final end. Word
+        # idx then runs from boundary idx to boundary idx + 1.
+        boundaries_fmt = self._format_times_bulk([word["start"] for word in words] + [words[-1]["end"]])
+
+        # The color never changes within a call, so build the wrapper tags
+        # once instead of re-formatting them around every word. Interning the
+        # open tag makes every segment render share one string object instead
+        # of allocating an identical copy per segment.
+        open_tag = sys.intern(f'<font color="{color}">')
+        close_tag = "</font>"
+
+        fragments = []
+        extend = fragments.extend
+        for idx in range(len(words)):
+            # Highlight the word
+            prefix = prefixes[idx]
+            suffix = suffixes[idx]
+            highlighted_text = f'{prefix}{" " if prefix else ""}{open_tag}{word_strs[idx]}{close_tag}{" " if suffix else ""}{suffix}'
+
+            extend((str(entry_index + idx), "\n", boundaries_fmt[idx], " --> ", boundaries_fmt[idx + 1], "\n", highlighted_text, "\n\n"))
+
+        return ''.join(fragments)
+
+    def _iter_srt_highlight_word(self, color="red"):
+        """
+        Yields one rendered string per segment of the highlighted-word SRT
+        output, in order.
+
+        Shared by `to_srt_highlight_word` and `write_srt_highlight_word`, so the
+        output can either be joined in memory or streamed straight to a file.
+        Entry indices are assigned up front, so segments render independently;
+        large transcripts fan the rendering out over a thread pool.
+        """
+        segments = self.segments
+        offsets = accumulate((len(segment["words"]) for segment in segments), initial=1)
+        if len(segments) >= _PARALLEL_SEGMENT_THRESHOLD:
+            with ThreadPoolExecutor() as executor:
+                yield from executor.map(self._render_highlight_segment, segments, offsets, repeat(color))
+        else:
+            yield from map(self._render_highlight_segment, segments, offsets, repeat(color))
+
     def to_srt_highlight_word(self, color="red"):
         """
         Generates an SRT (SubRip Subtitle) formatted string with specific words highlighted.
@@ -171,31 +367,50 @@ class SRTConverter:
 
         Parameters:
             color (str): The color used for highlighting words. Default is "red".
-            less than or equal to this value, the end time of the first caption will be adjusted to match the start time of the second caption to prevent
-            flickering of captions
 
         Returns:
             str: A string formatted in SRT format with highlighted words.
         """
-        srt_data = []
-        entry_index = 1
-        for segment in self.segments:
-            split_text = segment["text"].split()
-
-            for idx, word_info in enumerate(segment["words"]):
-                start_time = self.format_time(word_info["start"])
-                end_time = self.format_time(word_info["end"]) if idx == len(segment["words"]) - 1 else self.format_time(segment["words"][idx + 1]["start"])
+        return ''.join(self._iter_srt_highlight_word(color))
 
-                # Highlight the word
-                modified_text = split_text.copy()
-                modified_text[idx] = f'<font color="{color}">{modified_text[idx]}</font>'
-                highlighted_text = " ".join(modified_text)
-
-                # Add entry to SRT data
-                srt_data.append(f"{entry_index}\n{start_time} --> {end_time}\n{highlighted_text}\n")
-                entry_index += 1
+    def write_srt_highlight_word(self, filename, color="red"):
+        """
+        Streams the highlighted-word SRT output directly to a file, without
+        building the whole string in memory first.
+        """
+        with open(filename, "w", encoding="utf-8") as file:
+            file.writelines(self._iter_srt_highlight_word(color))
 
-        return '\n'.join(srt_data)
+    def _render_single_words_range(self, lo, hi, entry_index):
+        """
+        Renders the single-word SRT entries for the word index range
+        [lo, hi) as one string, numbering them from `entry_index`.
+        """
+        if lo == hi:
+            return ""
+        starts, ends, texts, _ = self._flat_columns
+        boundaries_fmt = self._format_times_bulk(starts[lo:hi] + [ends[hi - 1]])
+
+        fragments = []
+        extend = fragments.extend
+        for idx in range(hi - lo):
+            extend((str(entry_index + idx), "\n", boundaries_fmt[idx], " --> ", boundaries_fmt[idx + 1], "\n", texts[lo + idx], "\n\n"))
+        return ''.join(fragments)
+
+    def _iter_srt_single_words(self):
+        """
+        Yields one rendered string per segment of the single-word SRT output,
+        in order. Large transcripts render their segments on a thread pool.
+        """
+        _, _, _, bounds = self._flat_columns
+        lows = bounds[:-1]
+        highs = bounds[1:]
+        offsets = [lo + 1 for lo in lows]
+        if len(lows) >= _PARALLEL_SEGMENT_THRESHOLD:
+            with ThreadPoolExecutor() as executor:
+                yield from executor.map(self._render_single_words_range, lows, highs, offsets)
+        else:
+            yield from map(self._render_single_words_range, lows, highs, offsets)
 
     def to_srt_single_words(self):
         """
@@ -206,25 +421,50 @@ class SRTConverter:
         Returns:
             str: A string formatted in SRT format with each word as a separate subtitle entry.
         """
-        srt_entries = []
+        return ''.join(self._iter_srt_single_words())
+
+    def write_srt_single_words(self, filename):
+        """
+        Streams the single-word SRT output directly to a file.
+        """
+        with open(filename, "w", encoding="utf-8") as file:
+            file.writelines(self._iter_srt_single_words())
+    
+    def _iter_chunked_words(self, words_per_segment):
+        """
+        Yields (start, end, text) tuples for chunks of `words_per_segment`
+        consecutive words, computed directly from the flat word columns
+        without materializing intermediate segment dictionaries.
+        """
+        starts, ends, texts, _ = self._flat_columns
+        return _make_chunk_emitter(words_per_segment)(starts, ends, texts)
+
+    def _iter_srt_plain_text(self, words_per_segment=None):
+        """
+        Yields the string fragments of the plain-text SRT output in order.
+        """
+        fmt = self.format_time
         entry_index = 1
-        for segment in self.segments:
-            for idx, word in enumerate(segment["words"]):
-                start_time = self.format_time(word["start"])
-                end_time = self.format_time(word["end"]) if idx == len(segment["words"]) - 1 else self.format_time(segment["words"][idx + 1]["start"])
 
-                text = word["word"]
-                srt_entries.append(f"{entry_index}\n{start_time} --> {end_time}\n{text}")
-                entry_index += 1
+        if words_per_segment is not None:
+            # Chunk the flat word list directly; no segment dicts are built and
+            # self.segments is not clobbered as a side effect.
+            entries = self._iter_chunked_words(words_per_segment)
+        else:
+            # Use existing segments
+            entries = ((segment["start"], segment["end"], segment["text"]) for segment in self.segments)
+
+        for start, end, text in entries:
+            yield from (str(entry_index), "\n", fmt(start), " --> ", fmt(end), "\n", text, "\n\n")
+            entry_index += 1
 
-        return '\n\n'.join(srt_entries)
-    
     def to_srt_plain_text(self, words_per_segment=None):
         """
         Generates an SRT (SubRip Subtitle) formatted string with plain text segments.
 
         Each segment's text is presented as a subtitle entry, without highlighting any specific words.
-        Optionally, segments can be divided based on the specified number of words per segment.
+        Optionally, segments can be divided based on the specified number of words per segment;
+        this regrouping is done on the fly and leaves the object's `segments` untouched.
 
         Parameters:
             words_per_segment (int, optional): The number of words to include in each segment. If None, use existing segments.
@@ -232,25 +472,14 @@ class SRTConverter:
         Returns:
             str: A string formatted in SRT format with plain text subtitles.
         """
-        srt_entries = []
-        entry_index = 1
-
-        if words_per_segment is not None:
-            # Adjust the word segments according to the specified words per segment
-            adjusted_segments = self.adjust_word_per_segment(words_per_segment)
-        else:
-            # Use existing segments
-            adjusted_segments = self.segments
-
-        for segment in adjusted_segments:
-            start_time = self.format_time(segment["start"])
-            end_time = self.format_time(segment["end"])
-
-            text = segment["text"]
-            srt_entries.append(f"{entry_index}\n{start_time} --> {end_time}\n{text}")
-            entry_index += 1
+        return ''.join(self._iter_srt_plain_text(words_per_segment))
 
-        return '\n\n'.join(srt_entries)
+    def write_srt_plain_text(self, filename, words_per_segment=None):
+        """
+        Streams the plain-text SRT output directly to a file.
+        """
+        with open(filename, "w", encoding="utf-8") as file:
+            file.writelines(self._iter_srt_plain_text(words_per_segment))
 
     @staticmethod
     def create_segments_from_words(word_segments, words_per_segment=5):
@@ -267,18 +496,25 @@ class SRTConverter:
         """
         new_segments = []
 
-        # Function to fill in missing start/end times
-        def fill_missing_times(words):
-            for i, word in enumerate(words):
-                if 'start' not in word or 'end' not in word:
-                    prev_word = words[i - 1] if i > 0 else None
-                    next_word = words[i + 1] if i < len(words) - 1 else None
+        # Fill in missing start/end times across the whole word list in one
+        # linear pre-pass, instead of re-scanning inside every chunk. A word
+        # at a chunk boundary can now also borrow the time of its neighbour
+        # in the adjacent chunk.
+        last_index = len(word_segments) - 1
+        prev_end = None
+        for i, word in enumerate(word_segments):
+            if 'start' not in word or 'end' not in word:
+                next_word = word_segments[i + 1] if i < last_index else None
+
+                if 'start' not in word:
+                    word['start'] = prev_end if prev_end is not None else next_word['start'] if next_word and 'start' in next_word else 0
 
-                    if 'start' not in word:
-                        word['start'] = prev_word['end'] if prev_word and 'end' in prev_word else next_word['start'] if next_word and 'start' in next_word else 0
+                if 'end' not in word:
+                    word['end'] = next_word['start'] if next_word and 'start' in next_word else prev_end if prev_end is not None else word['start']
+
+            prev_end = word['end']
 
-                    if 'end' not in word:
-                        word['end'] = next_word['start'] if next_word and 'start' in next_word else prev_word['end'] if prev_word and 'end' in prev_word else word['start']
+        texts = [word["word"] for word in word_segments]
 
         for i in range(0, len(word_segments), words_per_segment):
             chunk = word_segments[i: i + words_per_segment]
@@ -287,59 +523,82 @@ class SRTConverter:
             if not chunk:
                 break
 
-            fill_missing_times(chunk)
-
-            start_time = chunk[0]["start"]  # Start time of the first word in the chunk
-            end_time = chunk[-1]["end"]     # End time of the last word in the chunk
-            segment_text = " ".join(word["word"] for word in chunk)
-
             segment = {
-                "start": start_time,
-                "end": end_time,
-                "text": segment_text,
+                "start": chunk[0]["start"],  # Start time of the first word in the chunk
+                "end": chunk[-1]["end"],     # End time of the last word in the chunk
+                "text": " ".join(texts[i: i + words_per_segment]),
                 "words": chunk,
             }
             new_segments.append(segment)
 
         return new_segments
 
+    @staticmethod
+    def _format_times_bulk(times):
+        """
+        Formats an iterable of times (in seconds) into SRT timestamps in one pass.
+
+        Shared kernel for the per-word SRT writers: the divmod arithmetic runs
+        back to back over the whole batch and each field is looked up in the
+        precomputed zero-padded numeral tables instead of going through a
+        format spec.
+        """
+        two = _TWO_DIGITS
+        three = _THREE_DIGITS
+        formatted = []
+        append = formatted.append
+        for time_in_seconds in times:
+            milliseconds = int(time_in_seconds * 1000)
+            seconds, milliseconds = divmod(milliseconds, 1000)
+            minutes, seconds = divmod(seconds, 60)
+            hours, minutes = divmod(minutes, 60)
+            append(f"{two[hours] if hours < 100 else hours}:{two[minutes]}:{two[seconds]},{three[milliseconds]}")
+        return formatted
+
     @staticmethod
     def format_time(time_in_seconds):
-        hours, remainder = divmod(time_in_seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        milliseconds = (seconds - int(seconds)) * 1000
-        return f"{int(hours):02d}:{int(minutes):02d}:{int(seconds):02d},{int(milliseconds):03d}"
+        # Quantize to integer milliseconds and go through the memoized
+        # formatter; shared boundary timestamps are formatted only once.
+        return _format_ms(int(time_in_seconds * 1000))
 
     @staticmethod
-    def write_to_file(filename, srt_string):
-        try:
-            with open(filename, "w", encoding="utf-8") as file:
-                file.write(srt_string)
-        except:
-            Exception("Invalid SRT string")
+    def write_to_file(filename, srt_string, validate=False):
+        """
+        Writes an SRT string to a file.
+
+        Output produced by the to_srt_* methods is valid by construction, so
+        no parse is run by default; pass validate=True to check
+        externally-sourced strings before writing.
+        """
+        if validate and not SRTConverter.is_valid_srt_string(srt_string):
+            raise ValueError("Invalid SRT string")
+        with open(filename, "w", encoding="utf-8") as file:
+            file.write(srt_string)
 
     @staticmethod
     def prettify_xml(element):
         """Return a pretty-printed XML string for the Element."""
-        rough_string = ET.tostring(element, 'utf-8')
-        reparsed = minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent="  ")
+        # Indent in place and serialize once, instead of the old
+        # tostring -> minidom reparse -> toprettyxml round trip.
+        ET.indent(element, space="  ")
+        return ET.tostring(element, encoding="unicode")
 
     @staticmethod
     def is_valid_srt_string(srt_string):
         try:
-            list(srt.parse(srt_string))
+            # Drain the parser without materializing the subtitle objects.
+            deque(srt.parse(srt_string), maxlen=0)
             return True
-        except:
+        except (srt.SRTParseError, ValueError):
             return False
 
     @staticmethod
     def is_valid_srt_file(file_path):
         try:
             with open(file_path, "r", encoding="utf-8") as file:
-                srt.parse(file.read())
+                deque(srt.parse(file.read()), maxlen=0)
             return True
-        except:
+        except (OSError, srt.SRTParseError, ValueError):
             return False
         
     @staticmethod
@@ -348,6 +607,7 @@ class SRTConverter:
         Initializes the SRTConverter with multiple arrays of segments, normalizing their timestamps based on actual
         audio lengths. This is helpful if you had transcribed a long audio file in multiple parts, and want to combine
         the segments into one SRT file, considering actual audio segment lengths.
+        The input arrays are not modified; shifted copies are built instead.
 
         Parameters:
             segment_arrays (list of lists): A list containing arrays of segment dictionaries.
@@ -366,16 +626,22 @@ class SRTConverter:
             # Use the actual audio segment length to calculate the time offset
             time_offset = total_elapsed_time - segments[0]["start"]
 
-            for segment in segments:
-                # Normalize start and end times
-                segment["start"] += time_offset
-                segment["end"] += time_offset
-
-                for word in segment.get("words", []):
-                    word["start"] += time_offset
-                    word["end"] += time_offset
-
-                normalized_segments.append(segment)
+            if time_offset:
+                # Build shifted copies rather than mutating the caller's dicts.
+                normalized_segments.extend(
+                    {
+                        **segment,
+                        "start": segment["start"] + time_offset,
+                        "end": segment["end"] + time_offset,
+                        "words": [
+                            {**word, "start": word["start"] + time_offset, "end": word["end"] + time_offset}
+                            for word in segment.get("words", [])
+                        ],
+                    }
+                    for segment in segments
+                )
+            else:
+                normalized_segments.extend(segments)
 
             # Update total elapsed time using the actual length of the audio segment
             if index < len(audio_lengths):
@@ -1,8 +1,30 @@
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from xml.sax.saxutils import quoteattr
 
 from WhisperXSRTGenerator.segments import Segments
 
+# The document skeleton is fixed apart from the attribute values, so it is
+# emitted from a frozen template instead of building an ElementTree and
+# round-tripping it through minidom for pretty printing. Segment paragraphs
+# are appended between header and footer.
+_ITT_HEADER_TEMPLATE = """<?xml version="1.0" ?>
+<tt xmlns="http://www.w3.org/ns/ttml" xmlns:vt="http://namespace.itunes.apple.com/itt/ttml-extension#vertical" xmlns:ttp="http://www.w3.org/ns/ttml#parameter" xmlns:ittp="http://www.w3.org/ns/ttml/profile/imsc1#parameter" xmlns:tt_feature="http://www.w3.org/ns/ttml/feature/" xmlns:ebutts="urn:ebu:tt:style" xmlns:tts="http://www.w3.org/ns/ttml#styling" xmlns:tt_extension="http://www.w3.org/ns/ttml/extension/" xmlns:tt_profile="http://www.w3.org/ns/ttml/profile/" xmlns:ttm="http://www.w3.org/ns/ttml#metadata" xmlns:ry="http://namespace.itunes.apple.com/itt/ttml-extension#ruby" xmlns:itts="http://www.w3.org/ns/ttml/profile/imsc1#styling" xmlns:tt="http://www.w3.org/ns/ttml" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xml:lang={lang} ttp:dropMode={drop_mode} ttp:frameRate={frame_rate} ttp:frameRateMultiplier={frame_rate_multiplier} ttp:timeBase="smpte">
+  <head>
+    <styling>
+      <style xml:id={style_id} tts:color={color} tts:fontFamily={font_family} tts:fontSize={font_size} tts:fontStyle={font_style} tts:fontWeight={font_weight}/>
+    </styling>
+    <layout>
+      <region xml:id={region_id} tts:displayAlign={display_align} tts:extent={extent} tts:origin={origin} tts:writingMode={writing_mode}/>
+    </layout>
+  </head>
+  <body region={region_id} style={style_id}>
+    <div>
+"""
+
+_ITT_FOOTER = """    </div>
+  </body>
+</tt>
+"""
+
 
 class ITTGenerator:
     def __init__(
@@ -19,6 +41,10 @@ class ITTGenerator:
         self.lang = lang
         self.caption_region = "bottom"
         self.caption_style = "normal"
+        self.display_align = "after"
+        self.extent = "100% 15%"
+        self.origin = "0% 85%"
+        self.writing_mode = "lrtb"
         self.styles = {
             "color": "white",
             "fontFamily": "sansSerif",
@@ -28,6 +54,9 @@ class ITTGenerator:
         }
         self.segments = segments
         self.highlight_color = "yellow"
+        # Rendered header, reused across generate_xml calls until a setter
+        # changes something it depends on.
+        self._header_cache = None
 
     def setSegments(self, segments: list[Segments]):
         self.segments = segments
@@ -35,6 +64,7 @@ class ITTGenerator:
     def set_frame_rate(self, frame_rate, frame_rate_multiplier="1000 1001"):
         self.frame_rate = frame_rate
         self.frame_rate_multiplier = frame_rate_multiplier
+        self._header_cache = None
 
     def set_caption_region(
         self,
@@ -49,6 +79,7 @@ class ITTGenerator:
         self.extent = extent
         self.origin = origin
         self.writing_mode = writing_mode
+        self._header_cache = None
 
     def set_text_style(
         self,
@@ -68,75 +99,38 @@ class ITTGenerator:
             self.styles["fontStyle"] = fontStyle
         if fontWeight:
             self.styles["fontWeight"] = fontWeight
+        self._header_cache = None
 
     def set_highlight_color(self, color):
         self.highlight_color = color
 
-    def generate_xml(self):
-        # Define namespaces and create the root element
-        ET.register_namespace("", "http://www.w3.org/ns/ttml")
-        root = ET.Element(
-            "tt",
-            {
-                "xmlns": "http://www.w3.org/ns/ttml",
-                "xmlns:vt": "http://namespace.itunes.apple.com/itt/ttml-extension#vertical",
-                "xmlns:ttp": "http://www.w3.org/ns/ttml#parameter",
-                "xmlns:ittp": "http://www.w3.org/ns/ttml/profile/imsc1#parameter",
-                "xmlns:tt_feature": "http://www.w3.org/ns/ttml/feature/",
-                "xmlns:ebutts": "urn:ebu:tt:style",
-                "xmlns:tts": "http://www.w3.org/ns/ttml#styling",
-                "xmlns:tt_extension": "http://www.w3.org/ns/ttml/extension/",
-                "xmlns:tt_profile": "http://www.w3.org/ns/ttml/profile/",
-                "xmlns:ttm": "http://www.w3.org/ns/ttml#metadata",
-                "xmlns:ry": "http://namespace.itunes.apple.com/itt/ttml-extension#ruby",
-                "xmlns:itts": "http://www.w3.org/ns/ttml/profile/imsc1#styling",
-                "xmlns:tt": "http://www.w3.org/ns/ttml",
-                "xmlns:xsi": "http://www.w3.org/2001/XMLSchema-instance",
-                "xml:lang": self.lang,
-                "ttp:dropMode": self.drop_mode,
-                "ttp:frameRate": str(self.frame_rate),
-                "ttp:frameRateMultiplier": self.frame_rate_multiplier,
-                "ttp:timeBase": "smpte",
-            },
+    def _render_header(self):
+        if self._header_cache is not None:
+            return self._header_cache
+        # quoteattr adds the surrounding quotes and escapes any user-supplied
+        # attribute values.
+        self._header_cache = _ITT_HEADER_TEMPLATE.format(
+            lang=quoteattr(self.lang),
+            drop_mode=quoteattr(self.drop_mode),
+            frame_rate=quoteattr(str(self.frame_rate)),
+            frame_rate_multiplier=quoteattr(self.frame_rate_multiplier),
+            style_id=quoteattr(self.caption_style),
+            color=quoteattr(self.styles["color"]),
+            font_family=quoteattr(self.styles["fontFamily"]),
+            font_size=quoteattr(self.styles["fontSize"]),
+            font_style=quoteattr(self.styles["fontStyle"]),
+            font_weight=quoteattr(self.styles["fontWeight"]),
+            region_id=quoteattr(self.caption_region),
+            display_align=quoteattr(self.display_align),
+            extent=quoteattr(self.extent),
+            origin=quoteattr(self.origin),
+            writing_mode=quoteattr(self.writing_mode),
         )
+        return self._header_cache
 
-        # Create style and layout sections
-        head = ET.SubElement(root, "head")
-        styling = ET.SubElement(head, "styling")
-        ET.SubElement(styling, "style", {
-            "xml:id": self.caption_style,
-            "tts:color": self.styles["color"],
-            "tts:fontFamily": self.styles["fontFamily"],
-            "tts:fontSize": self.styles["fontSize"],
-            "tts:fontStyle": self.styles["fontStyle"],
-            "tts:fontWeight": self.styles["fontWeight"],
-        })
-
-        layout = ET.SubElement(head, "layout")
-        ET.SubElement(layout, "region", {
-            "xml:id": self.caption_region,
-            "tts:displayAlign": self.display_align,
-            "tts:extent": self.extent,
-            "tts:origin": self.origin,
-            "tts:writingMode": self.writing_mode,
-        })
-
-        body = ET.SubElement(root, "body", {"region": self.caption_region, "style": self.caption_style})
-        div = ET.SubElement(body, "div")
-        # Insert a placeholder within the div that will be replaced later
-        placeholder = ET.SubElement(div, "placeholder")
-
-        # Generate the initial XML string
-        xml_str = ET.tostring(root, 'utf-8')
-        pretty_xml = minidom.parseString(xml_str).toprettyxml(indent="  ")
-
-        # Generate all segments as formatted strings
+    def generate_xml(self):
         segment_strings = "".join(segment.to_itt_string() for segment in self.segments)
-
-        # Replace the placeholder tag with actual segment strings
-        final_xml = pretty_xml.replace("<placeholder/>", segment_strings)
-
-        return final_xml
+        return self._render_header() + segment_strings + _ITT_FOOTER
 
     def write_xml(self, file_path):
         with open(file_path, "w") as f:
@@ -144,11 +138,11 @@ class ITTGenerator:
         print(f"XML file written to {file_path}")
 
 
-# # Example usage:
-# itt_gen = ITTGenerator()
-# itt_gen.set_frame_rate(30, "1000 1000")
-# itt_gen.set_caption_region("bottom", "after", "80% 10%", "10% 90%", "lrtb")
-# itt_gen.set_text_style(color="white", fontFamily="Arial", fontSize="150%", fontStyle="normal", fontWeight="bold")
-# xml_content = itt_gen.generate_xml()
-# itt_gen.write_xml("example.itt")
-# print(xml_content)
+if __name__ == "__main__":
+    # Example usage; only runs when the module is executed directly, never on
+    # import.
+    itt_gen = ITTGenerator(segments=[])
+    itt_gen.set_frame_rate(30, "1000 1000")
+    itt_gen.set_caption_region("bottom", "after", "80% 10%", "10% 90%", "lrtb")
+    itt_gen.set_text_style(color="white", fontFamily="Arial", fontSize="150%", fontStyle="normal", fontWeight="bold")
+    print(itt_gen.generate_xml())
@@ -1,19 +1,64 @@
 import copy
+from functools import lru_cache
+from itertools import chain
 
 class ITTTime:
+    # Immutable value type: once constructed, a timecode never changes.
+    # Adjustments (gap closing, frame-rate updates) replace the reference,
+    # which makes sharing one instance between adjacent segments safe.
+    __slots__ = ('frame_rate', 'hours', 'minutes', 'seconds', 'frames', '_str')
+
     def __init__(self, time_in_seconds, frame_rate):
-        self.frame_rate = frame_rate
+        object.__setattr__(self, 'frame_rate', frame_rate)
         hours, remainder = divmod(time_in_seconds, 3600)
         minutes, full_seconds = divmod(remainder, 60)
-        self.hours = int(hours)
-        self.minutes = int(minutes)
-        self.seconds = int(full_seconds)
-        self.frames = int((time_in_seconds % 1) * frame_rate)
+        object.__setattr__(self, 'hours', int(hours))
+        object.__setattr__(self, 'minutes', int(minutes))
+        object.__setattr__(self, 'seconds', int(full_seconds))
+        object.__setattr__(self, 'frames', int((time_in_seconds % 1) * frame_rate))
+        object.__setattr__(self, '_str', None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"ITTTime is immutable; cannot set {name!r}")
+
+    def __eq__(self, other):
+        if not isinstance(other, ITTTime):
+            return NotImplemented
+        return (self.frame_rate == other.frame_rate
+                and self.hours == other.hours
+                and self.minutes == other.minutes
+                and self.seconds == other.seconds
+                and self.frames == other.frames)
+
+    def __hash__(self):
+        return hash((self.frame_rate, self.hours, self.minutes, self.seconds, self.frames))
 
     def __str__(self):
-        return f"{self.hours:02}:{self.minutes:02}:{self.seconds:02}:{self.frames:02}"
+        # The formatted timecode is built once and reused across calls.
+        if self._str is None:
+            object.__setattr__(self, '_str', f"{self.hours:02}:{self.minutes:02}:{self.seconds:02}:{self.frames:02}")
+        return self._str
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # Immutable, so copies can share the instance.
+        return self
+
+    @classmethod
+    def get(cls, time_in_seconds, frame_rate):
+        """Cached factory; boundary times repeat heavily across segments."""
+        return _cached_itt_time(time_in_seconds, frame_rate)
+
+
+@lru_cache(maxsize=4096)
+def _cached_itt_time(time_in_seconds, frame_rate):
+    return ITTTime(time_in_seconds, frame_rate)
 
 class Word:
+    __slots__ = ('start', 'end', 'text', 'score', 'highlighted', 'frame_rate', 'itt_start', 'itt_end')
+
     def __init__(self, word, frame_rate=None):
         self.start = word["start"]
         self.end = word["end"]
@@ -27,10 +72,31 @@ class Word:
     def __repr__(self):
         return f"Word({self.start} -> {self.end}, {self.text}, highlighted={self.highlighted}, frame_rate={self.frame_rate})"
 
+    def __copy__(self):
+        new = Word.__new__(Word)
+        new.start = self.start
+        new.end = self.end
+        new.text = self.text
+        new.score = self.score
+        new.highlighted = self.highlighted
+        new.frame_rate = self.frame_rate
+        new.itt_start = self.itt_start
+        new.itt_end = self.itt_end
+        return new
+
+    def __deepcopy__(self, memo):
+        new = self.__copy__()
+        memo[id(self)] = new
+        if new.itt_start is not None:
+            new.itt_start = copy.deepcopy(new.itt_start, memo)
+        if new.itt_end is not None:
+            new.itt_end = copy.deepcopy(new.itt_end, memo)
+        return new
+
     def calculate_itt_time(self):
         if self.frame_rate:
-            self.itt_start = ITTTime(self.start, self.frame_rate)
-            self.itt_end = ITTTime(self.end, self.frame_rate)
+            self.itt_start = ITTTime.get(self.start, self.frame_rate)
+            self.itt_end = ITTTime.get(self.end, self.frame_rate)
     
     def convertToDictionary(self):
         return {
@@ -42,34 +108,69 @@ class Word:
         }
 
 class Segments:
-    def __init__(self, segment, frame_rate=None):
+    __slots__ = ('start', 'end', 'text', 'words', 'frame_rate', 'itt_start', 'itt_end')
+
+    def __init__(self, segment, frame_rate=None, *, _words=None):
         self.start = segment["start"]
         self.end = segment["end"]
         self.text = segment["text"]
-        self.words = [Word(word, frame_rate) for word in segment["words"]]
+        # _words lets internal callers adopt already-built Word instances
+        # directly, skipping the dict round-trip through Word.__init__.
+        self.words = _words if _words is not None else [Word(word, frame_rate) for word in segment["words"]]
         self.frame_rate = frame_rate
         self.itt_start = None
         self.itt_end = None
 
     def __repr__(self):
         return f"Segments({self.start}, {self.end}, {self.text}, frame_rate={self.frame_rate}, words={self.words})"
-    
+
+    def __copy__(self):
+        # Structural copy for the gap-closing pass: segment-level timing
+        # fields are cloned, while the untouched words are shared by
+        # reference. The immutable ITTTime instances are shared as well.
+        new = Segments.__new__(Segments)
+        new.start = self.start
+        new.end = self.end
+        new.text = self.text
+        new.words = self.words
+        new.frame_rate = self.frame_rate
+        new.itt_start = self.itt_start
+        new.itt_end = self.itt_end
+        return new
+
+    def __deepcopy__(self, memo):
+        new = Segments.__new__(Segments)
+        memo[id(self)] = new
+        new.start = self.start
+        new.end = self.end
+        new.text = self.text
+        new.words = [copy.deepcopy(word, memo) for word in self.words]
+        new.frame_rate = self.frame_rate
+        new.itt_start = copy.deepcopy(self.itt_start, memo) if self.itt_start else None
+        new.itt_end = copy.deepcopy(self.itt_end, memo) if self.itt_end else None
+        return new
+
     def generate_subsegments(self):
-        self.calculate_itt_times()  # Calculate iTT times for the entire segment first
+        # The parent's iTT times are not consumed here: every sub-segment
+        # recomputes its own from its word-level timeframe below.
         newSegments = []
+        # Each sub-segment shares the parent's Word instances and only clones
+        # the one word it highlights, so no dict round-trip or per-word
+        # rebuild happens per sub-segment.
         for idx, word in enumerate(self.words):
-            newWords = copy.deepcopy(self.words)
-            currentWord = newWords[idx]
-            currentWord.highlighted = True
-            newSegment = Segments({"start": word.start, "end": word.end, "text": self.text, "words": [w.convertToDictionary() for w in newWords]}, self.frame_rate)
+            highlightedWord = copy.copy(word)
+            highlightedWord.highlighted = True
+            subWords = list(self.words)
+            subWords[idx] = highlightedWord
+            newSegment = Segments({"start": word.start, "end": word.end, "text": self.text}, self.frame_rate, _words=subWords)
             newSegment.calculate_itt_times()  # Update iTT times based on the new segment's timeframe
             newSegments.append(newSegment)
         return newSegments
 
     def calculate_itt_times(self):
         if self.frame_rate:
-            self.itt_start = ITTTime(self.start, self.frame_rate)
-            self.itt_end = ITTTime(self.end, self.frame_rate)
+            self.itt_start = ITTTime.get(self.start, self.frame_rate)
+            self.itt_end = ITTTime.get(self.end, self.frame_rate)
         for word in self.words:
             word.calculate_itt_time()
 
@@ -84,48 +185,54 @@ class Segments:
             raise ValueError("ITT start or end times are not calculated.")
 
         # Begin the paragraph tag with the formatted iTT start and end times
-        result = f'<p begin="{self.itt_start}" end="{self.itt_end}" region="{region}">\n'
+        parts = [f'<p begin="{self.itt_start}" end="{self.itt_end}" region="{region}">\n']
 
         # Iterate through each word in the segment to format it appropriately
         for word in self.words:
             if word.highlighted:
                 # Wrap highlighted words with a span tag and the specified color
-                result += f'<span tts:color="{highlight_color}">{word.text}</span> '
+                parts.append(f'<span tts:color="{highlight_color}">{word.text}</span> ')
             else:
                 # Add non-highlighted words directly
-                result += f'{word.text} '
+                parts.append(f'{word.text} ')
 
         # Close the paragraph tag
-        result += '</p>\n'
+        parts.append('</p>\n')
 
-        return result
+        return "".join(parts)
 
 def closeGapBetweenListOfSegments(segments, gap):
     if(len(segments) <= 1):
         return segments
-    newSegments = copy.deepcopy(segments)
+    # Only segment-level boundaries are adjusted below, so a structural copy
+    # per segment (sharing the word lists) replaces the full deepcopy.
+    newSegments = [copy.copy(segment) for segment in segments]
+    lastIdx = len(newSegments) - 1
+    previousSegment = newSegments[0]
     for idx in range(1, len(newSegments)):
-        previousSegment = newSegments[idx - 1]
         currentSegment = newSegments[idx]
-        if currentSegment.start - previousSegment.end < gap:
+        # Hoist the boundary values into locals; each dotted access in the
+        # loop body is an interpreter-level lookup that adds up over long
+        # transcripts.
+        prevEnd = previousSegment.end
+        curStart = currentSegment.start
+        if curStart - prevEnd < gap:
             # First see if the gap can be closed by just adjusting the frame rate ITT times
             # Check if they are the same time and the only difference is the frame
-            sameTime = previousSegment.itt_end.seconds == currentSegment.itt_start.seconds and previousSegment.itt_end.minutes == currentSegment.itt_start.minutes and previousSegment.itt_end.hours == currentSegment.itt_start.hours
+            prevITTEnd = previousSegment.itt_end
+            curITTStart = currentSegment.itt_start
+            sameTime = prevITTEnd.seconds == curITTStart.seconds and prevITTEnd.minutes == curITTStart.minutes and prevITTEnd.hours == curITTStart.hours
 
             if sameTime:
-                # Close the gap by manually adjusting the frame of the iTT time
-                # Previous segment adjustment
-                previousSegment.itt_end.frames = currentSegment.itt_start.frames
-                previousSegment.end = currentSegment.start
-
-                # Current segment adjustment
-                currentSegment.itt_start.frames = previousSegment.itt_end.frames
-                currentSegment.start = previousSegment.end
+                # Close the gap by snapping the boundary to one shared iTT
+                # time; ITTTime is immutable, so aliasing is safe.
+                previousSegment.itt_end = curITTStart
+                previousSegment.end = curStart
             else:
                 # If they are not the same time, we still know that the difference is less than the gap so we need to adjust by taking the avg of the two times, adjusting their time + frames
                 # Calculate the average time between the two segments
-                avgTime = (currentSegment.start + previousSegment.end) / 2
-                avgITTTime = ITTTime(avgTime, currentSegment.frame_rate)
+                avgTime = (curStart + prevEnd) / 2
+                avgITTTime = ITTTime.get(avgTime, currentSegment.frame_rate)
                 # Previous segment
                 previousSegment.itt_end = avgITTTime
                 previousSegment.end = avgTime
@@ -133,23 +240,29 @@ def closeGapBetweenListOfSegments(segments, gap):
                 # Current segment
                 currentSegment.itt_start = avgITTTime
                 currentSegment.start = avgTime
-    
-    # Post-fix to adjust any segments that start and end on the same frame
-    for idx in range(len(newSegments)):
-        segment = newSegments[idx]
-        # If the segment starts and ends on the same frame, adjust the start/end time to before and after
-        # Check if a before exists
-        if idx > 0:
-            previousSegment = newSegments[idx - 1]
-            if segment.start == segment.end:
-                segment.start = previousSegment.end
-                segment.itt_start = previousSegment.itt_end
-        # Check if an after exists
-        if idx < len(newSegments) - 1:
-            nextSegment = newSegments[idx + 1]
-            if segment.start == segment.end:
-                segment.end = nextSegment.start
-                segment.itt_end = nextSegment.itt_start
+
+        # Fix up the just-finalized previous segment if it starts and ends on
+        # the same frame: its own boundaries no longer change after this
+        # iteration, so the second full pass the old post-fix loop made is
+        # unnecessary. Snap the start back first, then the end forward.
+        # Re-read the boundaries here since the branch above may have moved them.
+        prevStart = previousSegment.start
+        prevEnd = previousSegment.end
+        if idx > 1 and prevStart == prevEnd:
+            beforeSegment = newSegments[idx - 2]
+            prevStart = beforeSegment.end
+            previousSegment.start = prevStart
+            previousSegment.itt_start = beforeSegment.itt_end
+        if prevStart == prevEnd:
+            previousSegment.end = currentSegment.start
+            previousSegment.itt_end = currentSegment.itt_start
+        previousSegment = currentSegment
+
+    # The final segment has no following boundary, so handle it after the loop
+    finalSegment = newSegments[lastIdx]
+    if finalSegment.start == finalSegment.end:
+        finalSegment.start = newSegments[lastIdx - 1].end
+        finalSegment.itt_start = newSegments[lastIdx - 1].itt_end
 
     return newSegments
 
@@ -157,10 +270,7 @@ def createSegmentsList(segments):
     return [Segments(segment) for segment in segments]
 
 def generateFlattenedSegments(segments):
-    flattenedSegments = []
-    for segment in segments:
-        flattenedSegments.extend(segment.generate_subsegments())
-    return flattenedSegments
+    return list(chain.from_iterable(segment.generate_subsegments() for segment in segments))
 
 def updateFrameRateForSegments(segments, new_frame_rate):
     for segment in segments: